@@ -36,7 +36,7 @@ class BitcoinError(BlockchainError):
     pass
 
 
-class BitcoinMessageHeader(BinaryMessage):
+class BitcoinMessageHeader(BinaryMessage, slots=True):
     non_serialized = "byte_order"
     byte_order = ByteOrder.LITTLE
 
@@ -271,7 +271,7 @@ class VarStr(bytes, serialization.AbstractPackable):
         return string
 
 
-class NetAddr(fluxture.structures.PackableStruct):
+class NetAddr(fluxture.structures.PackableStruct, slots=True):
     services: serialization.UInt64
     ip: serialization.BigEndian[serialization.IPv6Address]
     port: serialization.BigEndian[serialization.UInt16]
@@ -290,7 +290,7 @@ class NetAddr(fluxture.structures.PackableStruct):
         super().__init__(services=services, ip=ip, port=port)
 
 
-class NetIP(fluxture.structures.PackableStruct):
+class NetIP(fluxture.structures.PackableStruct, slots=True):
     time: serialization.UInt32
     addr: NetAddr
 
@@ -367,9 +367,11 @@ class AbstractList(list, Generic[P], List[P], serialization.AbstractPackable, AB
         return list.__new__(cls, *args, **kwargs)
 
     def pack(self, byte_order: ByteOrder = ByteOrder.NETWORK) -> bytes:
-        return VarInt(len(self)).pack(byte_order) + b"".join(
-            element.pack(byte_order) for element in self
-        )
+        if hasattr(self.ELEMENT_TYPE, "pack_many"):
+            packed = self.ELEMENT_TYPE.pack_many(self, byte_order)
+        else:
+            packed = b"".join(element.pack(byte_order) for element in self)
+        return VarInt(len(self)).pack(byte_order) + packed
 
     @classmethod
     def unpack_partial(
@@ -379,14 +381,20 @@ class AbstractList(list, Generic[P], List[P], serialization.AbstractPackable, AB
         num_bytes = length * cls.ELEMENT_TYPE.num_bytes
         if num_bytes > len(remainder):
             raise UnpackError(f"Expected {num_bytes} bytes, but got {remainder!r}")
-        iters = [iter(remainder[:num_bytes])] * cls.ELEMENT_TYPE.num_bytes
-        return (
-            cls(
-                cls.ELEMENT_TYPE.unpack(bytes(data), byte_order=byte_order)
-                for data in zip(*iters)
-            ),
-            remainder[num_bytes:],
-        )
+        element_type = cls.ELEMENT_TYPE
+        if element_type.num_bytes == 0:
+            # the elements take up no space, so all that was packed is how many there are
+            elements = (element_type.unpack(b"", byte_order) for _ in range(length))
+        elif hasattr(element_type, "iter_unpack"):
+            elements = element_type.iter_unpack(remainder[:num_bytes], byte_order)
+        else:
+            elements = (
+                element_type.unpack(
+                    remainder[offset : offset + element_type.num_bytes], byte_order
+                )
+                for offset in range(0, num_bytes, element_type.num_bytes)
+            )
+        return cls(elements), remainder[num_bytes:]
 
     @classmethod
     async def read(
@@ -414,7 +422,7 @@ class Identifier(serialization.UInt32):
     MSG_FILTERED_WITNESS_BLOCK = serialization.UInt32((1 << 30) | 3)
 
 
-class Inventory(fluxture.structures.PackableStruct):
+class Inventory(fluxture.structures.PackableStruct, slots=True):
     identifier: Identifier
     hash: serialization.SizedByteArray[32]
 
@@ -448,7 +456,9 @@ class BitcoinNode(Node):
         self.version: Optional[VersionMessage] = None
 
     async def receive_message(self) -> Optional["BitcoinMessage"]:
-        return await BitcoinMessage.next_message(await self.reader)
+        if self._reader is None:
+            await self.connect()
+        return await BitcoinMessage.next_message(self._reader)
 
     async def connect(self):
         if self.connected or self.connecting:
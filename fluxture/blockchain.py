@@ -1,9 +1,10 @@
 import asyncio
 import socket
+import sys
 from abc import ABCMeta, abstractmethod
 from ipaddress import IPv4Address, IPv6Address, ip_address
-from typing import (AsyncIterator, Dict, FrozenSet, Generic, Optional, Tuple,
-                    Type, TypeVar, Union)
+from typing import (AsyncIterator, Dict, FrozenSet, Generic, Iterable,
+                    Optional, Tuple, Type, TypeVar, Union)
 
 from . import serialization
 from .messaging import Message
@@ -19,13 +20,26 @@ class Miner(serialization.IntEnum):
     NOT_MINER = 2
 
 
-def get_public_ip() -> Union[IPv4Address, IPv6Address]:
+_PUBLIC_IP: Optional[Union[IPv4Address, IPv6Address]] = None
+
+
+def refresh_public_ip() -> Union[IPv4Address, IPv6Address]:
+    """Looks up the IP address of the interface used to reach the internet, and caches it for `get_public_ip`"""
+    global _PUBLIC_IP
     s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     s.connect(("8.8.8.8", 80))
     try:
-        return ip_address(s.getsockname()[0])
+        _PUBLIC_IP = ip_address(s.getsockname()[0])
     finally:
         s.close()
+    return _PUBLIC_IP
+
+
+def get_public_ip() -> Union[IPv4Address, IPv6Address]:
+    # this is called for every handshake, so only create a socket the first time
+    if _PUBLIC_IP is None:
+        return refresh_public_ip()
+    return _PUBLIC_IP
 
 
 class Version:
@@ -35,6 +49,17 @@ class Version:
 
 
 class Node(metaclass=ABCMeta):
+    __slots__ = (
+        "address",
+        "port",
+        "source",
+        "_reader",
+        "_writer",
+        "_entries",
+        "_stop",
+        "_hash",
+    )
+
     def __init__(
         self,
         address: Union[str, bytes, IPv4Address, IPv6Address],
@@ -51,6 +76,7 @@ class Node(metaclass=ABCMeta):
         self._writer: Optional[asyncio.StreamWriter] = None
         self._entries: int = 0
         self._stop: Optional[asyncio.Event] = None
+        self._hash: Optional[int] = None
 
     @property
     def is_running(self) -> bool:
@@ -68,22 +94,16 @@ class Node(metaclass=ABCMeta):
         if self._stop is not None:
             await self._stop.wait()
 
-    @property
-    async def reader(self) -> asyncio.StreamReader:
-        if self._reader is None:
-            await self.connect()
-        return self._reader
-
-    @property
-    async def writer(self) -> asyncio.StreamWriter:
-        if self._writer is None:
-            await self.connect()
-        return self._writer
-
     async def connect(self):
         if self._reader is None:
+            # connect to IPv4 hosts directly by their IPv4 address rather than through their IPv6 mapping
+            ipv4 = self.address.ipv4_mapped
+            if ipv4 is not None:
+                host = str(ipv4)
+            else:
+                host = str(self.address)
             self._reader, self._writer = await asyncio.open_connection(
-                str(self.address),
+                host,
                 self.port,
                 happy_eyeballs_delay=0.25,  # this causes IPv4 and IPv6 attempts to be interleaved
             )
@@ -116,12 +136,28 @@ class Node(metaclass=ABCMeta):
             await self.close()
 
     async def send_message(self, message: Message):
-        writer = await self.writer
-        writer.write(message.serialize())
-        await writer.drain()
+        # check for an existing connection inline so that sending on an open connection does not create an
+        # extra coroutine per message
+        if self._writer is None:
+            await self.connect()
+        self._writer.write(message.serialize())
+        await self._writer.drain()
+
+    async def send_messages(self, messages: Iterable[Message]):
+        """Sends multiple messages with a single write and a single drain"""
+        if self._writer is None:
+            await self.connect()
+        buffer = bytearray()
+        for message in messages:
+            message.serialize_into(buffer)
+        self._writer.write(buffer)
+        await self._writer.drain()
 
     def __hash__(self):
-        return hash((self.address, self.port))
+        # nodes are looked up in sets and dicts constantly while crawling, and their address and port never change
+        if self._hash is None:
+            self._hash = hash((self.address, self.port))
+        return self._hash
 
     def __eq__(self, other):
         return (
@@ -156,7 +192,8 @@ class Blockchain(Generic[N], metaclass=ABCMeta):
             raise TypeError("Subclasses of `Blockchain` must define a `name`")
         if not hasattr(cls, "node_type") or cls.node_type is None:
             raise TypeError("Subclasses of `Blockchain` must define a `node_type`")
-        BLOCKCHAINS[cls.name] = cls
+        # intern the name so that lookups with an interned key can match on identity
+        BLOCKCHAINS[sys.intern(cls.name)] = cls
 
     @classmethod
     @abstractmethod
@@ -350,7 +350,7 @@ class NodeCommand(Command):
         )
 
     def run(self, args: Namespace):
-        blockchain_type = BLOCKCHAINS[args.BLOCKCHAIN_NAME]
+        blockchain_type = BLOCKCHAINS[sys.intern(args.BLOCKCHAIN_NAME)]
         with CrawlDatabase() as db:
             for neighbor in sorted(
                 str(n.address)
@@ -467,7 +467,7 @@ class CrawlCommand(Command):
                 "Run with `--database` to set a path for the database to be saved.\n"
             )
 
-        blockchain_type = BLOCKCHAINS[args.BLOCKCHAIN_NAME]
+        blockchain_type = BLOCKCHAINS[sys.intern(args.BLOCKCHAIN_NAME)]
 
         if args.max_connections is None:
             max_file_handles, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
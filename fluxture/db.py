@@ -172,6 +172,8 @@ D = TypeVar("D", bound="Database")
 
 
 class Model(Struct[FieldType], Generic[D]):
+    # models keep per-instance state outside of their fields (e.g., `_db` and the implicit `rowid`)
+    __slots__ = ("__dict__",)
     non_serialized = "primary_key_name", "_db", "rowid"
     primary_key_name: str = "rowid"
     _db: Optional[D] = None
@@ -11,10 +11,16 @@ B = TypeVar("B", bound="BinaryMessage")
 
 
 class Message(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def serialize(self) -> bytes:
         raise NotImplementedError()
 
+    def serialize_into(self, buffer: bytearray):
+        """Appends the serialized message to the end of `buffer`"""
+        buffer += self.serialize()
+
     @classmethod
     @abstractmethod
     def deserialize(cls: M, data: bytes) -> M:
@@ -27,6 +33,8 @@ class Message(ABC):
 
 
 class BinaryMessage(PackableStruct, Message):
+    __slots__ = ()
+
     non_serialized = ("byte_order",)
     byte_order: ByteOrder = ByteOrder.NETWORK
 
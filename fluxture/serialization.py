@@ -160,6 +160,7 @@ class IntEnumMeta(ABCMeta, Generic[E]):
     __members__: OrderedDictType[str, E]
     min_value: int
     max_value: int
+    _INT_TYPE: "Type[SizedInteger]"
 
     def __init__(cls, name, bases, clsdict):
         super().__init__(name, bases, clsdict)
@@ -203,8 +204,9 @@ class IntEnumMeta(ABCMeta, Generic[E]):
                 setattr(cls, "DEFAULT", cls.__members__[clsdict["DEFAULT"]])
             else:
                 setattr(cls, "DEFAULT", next(iter(cls.__members__.values())))
-            # call get_type() to ensure that all of the values are within range
-            getattr(cls, "DEFAULT").get_type()
+            # call get_type() to ensure that all of the values are within range, and cache the result so packing
+            # does not have to search for the type every time
+            setattr(cls, "_INT_TYPE", getattr(cls, "DEFAULT").get_type())
 
     def __iter__(cls) -> Iterator[E]:
         return iter(cls.__members__.values())
@@ -228,6 +230,8 @@ class AbstractIntEnum(int, AbstractPackable, Generic[E], metaclass=IntEnumMeta[E
 
     @classmethod
     def get_type(cls: IntEnumMeta[E]) -> "Type[SizedInteger]":
+        if "_INT_TYPE" in cls.__dict__:
+            return cls._INT_TYPE
         for int_type in (UInt8, UInt16, UInt32, UInt64, Int8, Int16, Int32, Int64):
             if (
                 cls.min_value >= int_type.MIN_VALUE
@@ -517,6 +521,14 @@ class SizedIntegerMeta(ABCMeta):
     SIGNED: bool
     MAX_VALUE: int
     MIN_VALUE: int
+    _RANGE_OFFSET: int
+    _PACKERS: Dict[ByteOrder, struct.Struct]
+
+    def __new__(mcs, name, bases, clsdict):
+        # sized integers are created for every deserialized field, so make sure that no subclass (including the
+        # ones created by `BigEndian` and `LittleEndian`) gives its instances a `__dict__`
+        clsdict.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, clsdict)
 
     def __init__(cls, name, bases, clsdict):
         if (
@@ -536,6 +548,16 @@ class SizedIntegerMeta(ABCMeta):
             setattr(cls, "SIGNED", cls.FORMAT.islower())
             setattr(cls, "MAX_VALUE", 2 ** (cls.BITS - [0, 1][cls.SIGNED]) - 1)
             setattr(cls, "MIN_VALUE", [0, -(2 ** (cls.BITS - 1))][cls.SIGNED])
+            # shifts the valid range to [0, 2**BITS) so it can be checked with a single shift
+            setattr(cls, "_RANGE_OFFSET", -cls.MIN_VALUE)
+            setattr(
+                cls,
+                "_PACKERS",
+                {
+                    byte_order: struct.Struct(f"{byte_order.value}{cls.FORMAT}")
+                    for byte_order in ByteOrder
+                },
+            )
 
     @property
     def num_bytes(cls) -> int:
@@ -547,22 +569,24 @@ class SizedIntegerMeta(ABCMeta):
 
 
 class SizedInteger(int, metaclass=SizedIntegerMeta):
+    __slots__ = ()
+
     def __new__(cls: SizedIntegerMeta, value: int):
         retval: SizedInteger = int.__new__(cls, value)
-        if not (cls.MIN_VALUE <= retval <= cls.MAX_VALUE):
+        if (retval + cls._RANGE_OFFSET) >> cls.BITS:
             raise ValueError(
                 f"{retval} is not in the range [{cls.MIN_VALUE}, {cls.MAX_VALUE}]"
             )
         return retval
 
     def pack(self, byte_order: ByteOrder = ByteOrder.NETWORK) -> bytes:
-        return struct.pack(f"{byte_order.value}{self.__class__.FORMAT}", self)
+        return self.__class__._PACKERS[byte_order].pack(self)
 
     @classmethod
     def unpack(
         cls, data: bytes, byte_order: ByteOrder = ByteOrder.NETWORK
     ) -> "SizedInteger":
-        return cls(struct.unpack(f"{byte_order.value}{cls.FORMAT}", data)[0])
+        return cls(cls._PACKERS[byte_order].unpack(data)[0])
 
     @classmethod
     def unpack_partial(
@@ -570,11 +594,7 @@ class SizedInteger(int, metaclass=SizedIntegerMeta):
     ) -> Tuple[P, bytes]:
         try:
             return (
-                cls(
-                    struct.unpack(f"{byte_order.value}{cls.FORMAT}", data[: cls.BYTES])[
-                        0
-                    ]
-                ),
+                cls(cls._PACKERS[byte_order].unpack(data[: cls.BYTES])[0]),
                 data[cls.BYTES :],
             )
         except struct.error:
@@ -1,33 +1,478 @@
 import asyncio
-import itertools
+import struct
+import sys
 from abc import ABCMeta
 from collections import OrderedDict
-from typing import Generic, Iterator, KeysView
+from types import FrameType
+from typing import Any, Callable, Dict, Generic, Iterator, KeysView
 from typing import OrderedDict as OrderedDictType
-from typing import Tuple, Type, TypeVar
+from typing import Optional, Sequence, Set, Tuple, Type, TypeVar, Union
 from typing import ValuesView
 from typing import ValuesView as ValuesViewType
+from weakref import WeakKeyDictionary
+
+import numpy as np
 
 from fluxture.serialization import (AbstractIntEnum, ByteOrder, FixedSize, P,
-                                    Packable, UnpackError)
+                                    SizedInteger, SizedIntegerMeta,
+                                    UnpackError)
 
 F = TypeVar("F")
+C = TypeVar("C", bound=Callable)
+
+# sentinel for arguments that were not passed to a generated `__init__`
+MISSING = object()
+
+
+def fused_packers(
+    fields: OrderedDictType[str, Type[F]],
+) -> Dict[ByteOrder, struct.Struct]:
+    """Returns a `struct.Struct` per byte order that (un)packs all of the fields at once, if possible"""
+    for field_type in fields.values():
+        if (
+            not isinstance(field_type, SizedIntegerMeta)
+            or field_type.pack is not SizedInteger.pack
+            or field_type.unpack_partial.__func__
+            is not SizedInteger.unpack_partial.__func__
+        ):
+            # this field has custom packing logic, so it needs to be packed on its own
+            return {}
+    fmt = "".join(field_type.FORMAT for field_type in fields.values())
+    num_bytes = sum(field_type.BYTES for field_type in fields.values())
+    packers = {}
+    for byte_order in ByteOrder:
+        packer = struct.Struct(f"{byte_order.value}{fmt}")
+        # native byte order can add alignment padding between fields, which packing them individually does not
+        if packer.size == num_bytes:
+            packers[byte_order] = packer
+    return packers
+
+
+NUMPY_BYTE_ORDERS: Dict[ByteOrder, str] = {
+    ByteOrder.NATIVE: "=",
+    ByteOrder.LITTLE: "<",
+    ByteOrder.BIG: ">",
+    ByteOrder.NETWORK: ">",
+}
+
+
+def numpy_dtypes(
+    fields: OrderedDictType[str, Type[F]], packers: Dict[ByteOrder, struct.Struct]
+) -> Dict[ByteOrder, np.dtype]:
+    """Returns a structured numpy dtype per byte order whose records have the same layout as the packed struct"""
+    if not fields:
+        return {}
+    return {
+        byte_order: np.dtype(
+            [
+                (
+                    field_name,
+                    f"{NUMPY_BYTE_ORDERS[byte_order]}{['u', 'i'][field_type.SIGNED]}{field_type.BYTES}",
+                )
+                for field_name, field_type in fields.items()
+            ]
+        )
+        for byte_order in packers
+    }
+
+
+# the frames of the functions in which structs with string annotations were defined
+DEFINING_FRAMES: "WeakKeyDictionary[type, FrameType]" = WeakKeyDictionary()
+
+
+def defining_frame() -> Optional[FrameType]:
+    """Returns the frame of the function whose body is defining a struct, or None if it is defined at module level
+
+    This must be called from `StructMeta.__new__`.
+
+    """
+    frame = sys._getframe(2)
+    # skip over calls through a subscripted metaclass, like `StructMeta[Model]`
+    while frame is not None and frame.f_globals.get("__name__") == "typing":
+        frame = frame.f_back
+    if frame is None or frame.f_locals is frame.f_globals:
+        return None
+    return frame
+
+
+class Deferred:
+    """Placeholder for a class attribute that depends on fields whose types could not be resolved yet
+
+    The first time the attribute is accessed, the fields are resolved and the placeholder replaced.
+
+    """
+
+    def __init__(self, name: str):
+        self.name: str = name
+
+    def __get__(self, instance, owner):
+        owner.resolve_deferred_fields()
+        if instance is None:
+            return getattr(owner, self.name)
+        return getattr(instance, self.name)
+
+
+# everything that StructMeta sets up from the types of a class's fields
+DEFERRED_ATTRIBUTES: Tuple[str, ...] = (
+    "FIELDS",
+    "num_bytes",
+    "_PACKERS",
+    "_NP_DTYPES",
+    "_STR_TEMPLATE",
+    "_init_fields",
+    "_from_raw",
+    "__init__",
+    "pack",
+    "__eq__",
+    "__hash__",
+)
+
+
+def str_template(cls, fields: OrderedDictType[str, Type[F]]) -> str:
+    """Returns a %-format string that renders an instance of the struct, given the values of its fields"""
+    types = "".join(f"    {field_name} = %s;\n" for field_name in fields)
+    newline = "\n"
+    name = cls.__name__.replace("%", "%%")
+    return f"typedef struct {{{['', newline][len(types) > 0]}{types}}} {name}"
+
+
+def specializable(func: C) -> C:
+    """Marks a generic method that StructMeta may replace with one generated for a specific subclass"""
+    setattr(func, "__specializable__", True)
+    return func
+
+
+def is_specializable(cls, method_name: str) -> bool:
+    return method_name not in cls.__dict__ and getattr(
+        getattr(cls, method_name, None), "__specializable__", False
+    )
+
+
+def field_default(field_type) -> Any:
+    if (
+        hasattr(field_type, "column_options")
+        and field_type.column_options is not None
+        and field_type.column_options.default is not None
+    ):
+        return field_type.column_options.default
+    elif isinstance(field_type, type) and issubclass(field_type, AbstractIntEnum):
+        return field_type.DEFAULT
+    return MISSING
+
+
+def missing_argument(self, field_name: str):
+    raise ValueError(f"Missing argument for {field_name} in {self.__class__}")
+
+
+def unexpected_keywords(self, kwargs: Dict[str, Any]):
+    raise TypeError(
+        f"{self.__class__.__name__}.__init__() got an unexpected keyword argument '{next(iter(kwargs))}'. "
+        f"Valid arguments are: {', '.join(self.__class__.FIELDS.keys())}"
+    )
+
+
+def bind_positional(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Assigns positional arguments, in order, to whichever fields were not passed by keyword"""
+    unsatisfied_fields = [
+        field_name for field_name in self.__class__.FIELDS if field_name not in kwargs
+    ]
+    if len(args) > len(unsatisfied_fields):
+        raise ValueError(
+            f"Unexpected positional argument: {args[len(unsatisfied_fields)]}"
+        )
+    kwargs.update(zip(unsatisfied_fields, args))
+    return kwargs
+
+
+def generate_function(cls, name: str, source: str, namespace: Dict[str, Any]):
+    # generated code only uses names with a leading double underscore (including for builtins, which are bound into
+    # the namespace), which can never collide with a field name because annotations on such names are mangled by
+    # the class body
+    exec(source, namespace)
+    func = namespace[name]
+    func.__module__ = cls.__module__
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    return specializable(func)
+
+
+def root_struct(cls) -> type:
+    """Returns the class at the root of this class's chain of structs (i.e., `Struct`)"""
+    return [base for base in cls.__mro__ if isinstance(base, StructMeta)][-1]
+
+
+def has_cooperative_init(cls) -> bool:
+    """Returns whether a class after the root struct in the MRO (e.g., a mixin) defines its own `__init__`"""
+    mro = cls.__mro__
+    for base in mro[mro.index(root_struct(cls)) + 1 :]:
+        if "__init__" in base.__dict__:
+            return base is not object
+    return False
+
+
+def generate_init(cls, fields: OrderedDictType[str, Type[F]]) -> Callable[..., None]:
+    namespace: Dict[str, Any] = {
+        "__CLS": cls,
+        "__MISSING": MISSING,
+        "__missing_argument": missing_argument,
+        "__unexpected_keywords": unexpected_keywords,
+        "__bind_positional": bind_positional,
+        "__isinstance": isinstance,
+        "__len": len,
+        "__ROOT": root_struct(cls),
+        "__super": super,
+    }
+    lines = [
+        "def __init__(__self, *__args, **__kwargs):",
+        "    if __self.__class__ is not __CLS:",
+        "        # we were called through super() from a subclass, which has its own fields",
+        "        return __self.__class__._init_fields(__self, *__args, **__kwargs)",
+    ]
+    if fields:
+        # fast path for when every field is passed positionally
+        lines.extend(
+            [
+                f"    if not __kwargs and __len(__args) == {len(fields)}:",
+                f"        {', '.join(fields)}, = __args",
+                "    else:",
+            ]
+        )
+    else:
+        lines.extend(["    if not __kwargs and not __args:", "        pass", "    else:"])
+    lines.extend(
+        [
+            "        if __args:",
+            "            __kwargs = __bind_positional(__self, __args, __kwargs)",
+        ]
+    )
+    lines.extend(
+        f"        {field_name} = __kwargs.pop({field_name!r}, __MISSING)" for field_name in fields
+    )
+    lines.extend(["        if __kwargs:", "            __unexpected_keywords(__self, __kwargs)"])
+    required = []
+    for i, (field_name, field_type) in enumerate(fields.items()):
+        default = field_default(field_type)
+        if default is MISSING:
+            required.append(field_name)
+        else:
+            namespace[f"__D{i}"] = default
+            lines.extend([f"    if {field_name} is __MISSING:", f"        {field_name} = __D{i}"])
+    if required:
+        # check all of the required arguments with a single branch, and only work out which is missing on failure
+        lines.append(f"    if {' or '.join(f'{field_name} is __MISSING' for field_name in required)}:")
+        for field_name in required:
+            lines.extend(
+                [
+                    f"        if {field_name} is __MISSING:",
+                    f"            __missing_argument(__self, {field_name!r})",
+                ]
+            )
+    for i, (field_name, field_type) in enumerate(fields.items()):
+        if cls.RAW_INTS:
+            # the value is stored as-is; the fused packer will check its range when it is packed
+            lines.append(f"    __self.{field_name} = {field_name}")
+        else:
+            namespace[f"__T{i}"] = field_type
+            lines.append(
+                f"    __self.{field_name} = {field_name} if __isinstance({field_name}, __T{i}) else "
+                f"__T{i}({field_name})"
+            )
+    if has_cooperative_init(cls):
+        # let any mixins that come after the structs in the MRO initialize themselves
+        lines.append("    __super(__ROOT, __self).__init__()")
+    return generate_function(cls, "__init__", "\n".join(lines), namespace)
+
+
+def generate_pack(
+    cls, fields: OrderedDictType[str, Type[F]], generic_pack: Callable[..., bytes]
+) -> Callable[..., bytes]:
+    namespace: Dict[str, Any] = {
+        "__CLS": cls,
+        "__NETWORK": ByteOrder.NETWORK,
+        "__PACKERS": cls._PACKERS,
+        "__generic_pack": generic_pack,
+    }
+    lines = [
+        "def pack(__self, byte_order=__NETWORK):",
+        "    if __self.__class__ is not __CLS:",
+        "        # we were called through super() from a subclass, which has its own fields",
+        "        return __generic_pack(__self, byte_order)",
+    ]
+    if cls._PACKERS:
+        values = "".join(f"__self.{field_name}, " for field_name in fields)
+        lines.extend(
+            [
+                "    __packer = __PACKERS.get(byte_order)",
+                "    if __packer is not None:",
+                f"        return __packer.pack({values})",
+            ]
+        )
+    if cls.RAW_INTS:
+        # the fields are plain ints, so they need to be wrapped in their types to be packed individually
+        namespace.update({f"__T{i}": field_type for i, field_type in enumerate(fields.values())})
+        packed = "".join(
+            f"__T{i}(__self.{field_name}).pack(byte_order), "
+            for i, field_name in enumerate(fields)
+        )
+    else:
+        packed = "".join(f"__self.{field_name}.pack(byte_order), " for field_name in fields)
+    lines.append(f'    return b"".join(({packed}))')
+    return generate_function(cls, "pack", "\n".join(lines), namespace)
+
+
+def generate_eq(
+    cls, fields: OrderedDictType[str, Type[F]], generic_eq: Callable[[Any, Any], bool]
+) -> Callable[[Any, Any], bool]:
+    namespace: Dict[str, Any] = {"__CLS": cls, "__generic_eq": generic_eq}
+    comparisons = " and ".join(
+        f"__self.{field_name} == __other.{field_name}" for field_name in fields
+    )
+    lines = [
+        "def __eq__(__self, __other):",
+        "    if __other.__class__ is __CLS:",
+        f"        return {comparisons or 'True'}",
+        "    # structs of different types are still equal if all of their fields are",
+        "    return __generic_eq(__self, __other)",
+    ]
+    return generate_function(cls, "__eq__", "\n".join(lines), namespace)
+
+
+def generate_from_raw(cls, fields: OrderedDictType[str, Type[F]]) -> Callable[..., Any]:
+    namespace: Dict[str, Any] = {"__new": object.__new__, "__int_new": int.__new__}
+    params = "".join(f"{field_name}, " for field_name in fields)
+    lines = [f"def _from_raw(__cls, {params}):", "    __self = __new(__cls)"]
+    for i, (field_name, field_type) in enumerate(fields.items()):
+        if isinstance(field_type, SizedIntegerMeta) and not cls.RAW_INTS:
+            # the value is trusted to be in range, so skip SizedInteger.__new__'s validation
+            namespace[f"__T{i}"] = field_type
+            lines.append(f"    __self.{field_name} = __int_new(__T{i}, {field_name})")
+        else:
+            lines.append(f"    __self.{field_name} = {field_name}")
+    lines.append("    return __self")
+    return generate_function(cls, "_from_raw", "\n".join(lines), namespace)
+
+
+def construct(cls, *values):
+    return cls(*values)
+
+
+def generate_hash(cls, fields: OrderedDictType[str, Type[F]]) -> Callable[[Any], int]:
+    values = "".join(f"__self.{field_name}, " for field_name in fields)
+    lines = ["def __hash__(__self):", f"    return __hash(({values}))"]
+    return generate_function(cls, "__hash__", "\n".join(lines), {"__hash": hash})
 
 
 class StructMeta(ABCMeta, Generic[F]):
     FIELDS: OrderedDictType[str, Type[F]]
+    _PACKERS: Dict[ByteOrder, struct.Struct]
+    _NP_DTYPES: Dict[ByteOrder, np.dtype]
+    _STR_TEMPLATE: str
+    RAW_INTS: bool = False
+    SLOTS: bool = False
+
+    def __new__(
+        mcs,
+        name,
+        bases,
+        clsdict,
+        raw_ints: Optional[bool] = None,
+        slots: Optional[bool] = None,
+    ):
+        if slots is None:
+            # inherit the setting
+            slots = any(getattr(base, "SLOTS", False) for base in bases)
+        if "__slots__" not in clsdict and slots:
+            # store the fields this class introduces in slots rather than in a per-instance __dict__. This is opt-in
+            # because two bases that both have non-empty slots cannot be combined through multiple inheritance.
+            non_serialized = StructMeta.non_serialized_names(clsdict)
+            new_fields = tuple(
+                field_name
+                for field_name in clsdict.get("__annotations__", ())
+                if field_name not in non_serialized
+            )
+            # a slot cannot share its name with a class attribute
+            if not any(field_name in clsdict for field_name in new_fields):
+                clsdict["__slots__"] = new_fields
+        cls = super().__new__(mcs, name, bases, clsdict)
+        if any(
+            isinstance(annotation, str)
+            for annotation in clsdict.get("__annotations__", {}).values()
+        ):
+            frame = defining_frame()
+            if frame is not None:
+                # the class was defined inside a function, so its string annotations might refer to that function's
+                # local variables
+                DEFINING_FRAMES[cls] = frame
+        return cls
+
+    @staticmethod
+    def non_serialized_names(clsdict) -> Set[str]:
+        if "non_serialized" in clsdict:
+            non_serialized = set(clsdict["non_serialized"])
+        else:
+            non_serialized = set()
+        return non_serialized | {"FIELDS", "non_serialized"}
+
+    def __init__(
+        cls,
+        name,
+        bases,
+        clsdict,
+        raw_ints: Optional[bool] = None,
+        slots: Optional[bool] = None,
+    ):
+        super().__init__(name, bases, clsdict)
+        # otherwise, these are inherited
+        if raw_ints is not None:
+            setattr(cls, "RAW_INTS", raw_ints)
+        if slots is not None:
+            setattr(cls, "SLOTS", slots)
+        try:
+            fields = cls.collect_fields()
+        except NameError:
+            # a field is annotated with a forward reference to a type that is not defined yet, so wait to set up
+            # the fields (and everything derived from them) until the class is first used
+            for attribute_name in DEFERRED_ATTRIBUTES:
+                if attribute_name not in clsdict:
+                    setattr(cls, attribute_name, Deferred(attribute_name))
+            return
+        cls.setup_fields(fields)
 
-    def __init__(cls, name, bases, clsdict):
+    def resolve_deferred_fields(cls):
+        for attribute_name in DEFERRED_ATTRIBUTES:
+            if isinstance(cls.__dict__.get(attribute_name, None), Deferred):
+                delattr(cls, attribute_name)
+        try:
+            fields = cls.collect_fields()
+        except NameError:
+            # put the placeholders back so we can try again later
+            for attribute_name in DEFERRED_ATTRIBUTES:
+                if attribute_name not in cls.__dict__:
+                    setattr(cls, attribute_name, Deferred(attribute_name))
+            raise
+        cls.setup_fields(fields)
+
+    def resolve_annotation(cls, field_type):
+        if isinstance(field_type, str):
+            # the annotation was postponed (e.g., by `from __future__ import annotations`)
+            namespace = dict(vars(cls))
+            frame = DEFINING_FRAMES.get(cls, None)
+            if frame is not None:
+                # the frame's locals are re-read, so this also sees classes defined after this one in the function
+                namespace = {**frame.f_locals, **namespace}
+            return eval(field_type, vars(sys.modules[cls.__module__]), namespace)
+        return field_type
+
+    def collect_fields(cls) -> OrderedDictType[str, Type[F]]:
         fields = OrderedDict()
         field_sources = {}
-        for base in bases:
+        for base in cls.__bases__:
             if isinstance(base, StructMeta):
                 # this will happen if a Struct is extending another Struct
                 # so inherit all of the superclass's fields
                 for field_name, field_type in base.FIELDS.items():
                     if field_name in fields:
                         raise TypeError(
-                            f"{name} inherits field {field_name} from both {base.__name__} and "
+                            f"{cls.__name__} inherits field {field_name} from both {base.__name__} and "
                             f"{field_sources[field_name]}"
                         )
                     elif hasattr(base, "non_serialized") and field_name not in getattr(
@@ -35,69 +480,66 @@ class StructMeta(ABCMeta, Generic[F]):
                     ):
                         field_sources[field_name] = base
                         fields[field_name] = field_type
-        if "non_serialized" in clsdict:
-            non_serialized = set(clsdict["non_serialized"])
-        else:
-            non_serialized = set()
-        non_serialized |= {"FIELDS", "non_serialized"}
-        if "__annotations__" in clsdict:
-            for field_name, field_type in clsdict["__annotations__"].items():
-                if field_name in field_sources:
-                    raise TypeError(
-                        f"{name} cannot redefine field {field_name} from {field_sources[field_name]}"
-                    )
-                elif field_name not in non_serialized:
-                    fields[field_name] = field_type
-        super().__init__(name, bases, clsdict)
+        non_serialized = StructMeta.non_serialized_names(cls.__dict__)
+        for field_name, field_type in cls.__dict__.get("__annotations__", {}).items():
+            if field_name in field_sources:
+                raise TypeError(
+                    f"{cls.__name__} cannot redefine field {field_name} from {field_sources[field_name]}"
+                )
+            elif field_name not in non_serialized:
+                try:
+                    fields[field_name] = cls.resolve_annotation(field_type)
+                except NameError as e:
+                    raise NameError(
+                        f"Could not resolve the type of field {field_name} of {cls.__name__}: {e}"
+                    ) from e
+        return fields
+
+    def setup_fields(cls, fields: OrderedDictType[str, Type[F]]):
         cls.validate_fields(fields)
         setattr(cls, "FIELDS", fields)
         # are all fields fixed size? if so, we are fixed size, too!
         if all(hasattr(field, "num_bytes") for field in fields.values()):
             cls.num_bytes = sum(field.num_bytes for field in fields.values())  # type: ignore
             assert isinstance(cls, FixedSize)
+        setattr(cls, "_PACKERS", fused_packers(fields))
+        if cls.RAW_INTS and fields and not cls._PACKERS:
+            raise TypeError(
+                f"{cls.__name__} stores its fields as raw ints, so all of its fields must be plain SizedIntegers"
+            )
+        setattr(cls, "_NP_DTYPES", numpy_dtypes(fields, cls._PACKERS))
+        setattr(cls, "_STR_TEMPLATE", str_template(cls, fields))
+        # generate straight-line methods specialized to this class's fields
+        init = generate_init(cls, fields)
+        setattr(cls, "_init_fields", init)
+        if getattr(cls.__init__, "__specializable__", False) and not has_cooperative_init(cls):
+            setattr(cls, "_from_raw", classmethod(generate_from_raw(cls, fields)))
+        else:
+            # this class (or one of its mixins) customizes its construction, so always go through its __init__
+            setattr(cls, "_from_raw", classmethod(construct))
+        if is_specializable(cls, "__init__"):
+            setattr(cls, "__init__", init)
+        if is_specializable(cls, "pack"):
+            setattr(cls, "pack", generate_pack(cls, fields, PackableStruct.pack))
+        if is_specializable(cls, "__eq__"):
+            setattr(cls, "__eq__", generate_eq(cls, fields, Struct.__eq__))
+        if is_specializable(cls, "__hash__"):
+            setattr(cls, "__hash__", generate_hash(cls, fields))
 
     def validate_fields(cls, fields: OrderedDictType[str, Type[F]]):
         pass
 
 
 class Struct(Generic[F], metaclass=StructMeta[F]):
+    __slots__ = ()
+    _init_fields: Callable[..., None]
+    # constructs an instance from already-validated field values, bypassing __init__ when possible
+    _from_raw: Callable[..., "Struct[F]"]
+
+    @specializable
     def __init__(self, *args, **kwargs):
-        unsatisfied_fields = [
-            name for name in self.__class__.FIELDS.keys() if name not in kwargs
-        ]
-        if len(args) > len(unsatisfied_fields):
-            raise ValueError(
-                f"Unexpected positional argument: {args[len(unsatisfied_fields)]}"
-            )
-        elif len(args) < len(unsatisfied_fields):
-            # see if any of the unsatisfied fields have defaults:
-            for name in unsatisfied_fields[len(args) :]:
-                field_type = self.__class__.FIELDS[name]
-                if (
-                    hasattr(field_type, "column_options")
-                    and field_type.column_options.default is not None
-                ):
-                    kwargs[name] = field_type.column_options.default
-                elif issubclass(field_type, AbstractIntEnum):
-                    kwargs[name] = field_type.DEFAULT
-                else:
-                    raise ValueError(f"Missing argument for {name} in {self.__class__}")
-            unsatisfied_fields = unsatisfied_fields[: len(args)]
-        for name, value in itertools.chain(
-            kwargs.items(), zip(unsatisfied_fields, args)
-        ):
-            if name not in self.__class__.FIELDS:
-                raise TypeError(
-                    f"{self.__class__.__name__}.__init__() got an unexpected keyword argument '{name}'. "
-                    f"Valid arguments are: {', '.join(self.__class__.FIELDS.keys())}"
-                )
-            elif isinstance(value, self.__class__.FIELDS[name]):
-                # the value was already passed as the correct type
-                setattr(self, name, value)
-            else:
-                # we need to construct the correct type
-                setattr(self, name, self.__class__.FIELDS[name](value))
-        super().__init__()
+        # subclasses that do not override __init__ call their generated `_init_fields` directly
+        self.__class__._init_fields(self, *args, **kwargs)
 
     def __contains__(self, field_name: str):
         return field_name in self.__class__.FIELDS
@@ -123,6 +565,7 @@ class Struct(Generic[F], metaclass=StructMeta[F]):
     def values(self) -> ValuesViewType[Type[F]]:
         return ValuesView(self)
 
+    @specializable
     def __eq__(self, other):
         return (
             isinstance(other, Struct)
@@ -133,13 +576,14 @@ class Struct(Generic[F], metaclass=StructMeta[F]):
     def __ne__(self, other):
         return not (self == other)
 
+    @specializable
+    def __hash__(self):
+        return hash(tuple(self.values()))
+
     def __str__(self):
-        types = "".join(
-            f"    {field_name} = {field_value!s};\n"
-            for field_name, field_value in self.items()
+        return self._STR_TEMPLATE % tuple(
+            getattr(self, field_name) for field_name in self.__class__.FIELDS
         )
-        newline = "\n"
-        return f"typedef struct {{{['', newline][len(types) > 0]}{types}}} {self.__class__.__name__}"
 
     def __repr__(self):
         args = [
@@ -148,18 +592,81 @@ class Struct(Generic[F], metaclass=StructMeta[F]):
         return f"{self.__class__.__name__}({', '.join(args)})"
 
 
+# the members of the `Packable` protocol
+PACKABLE_METHODS: Tuple[str, ...] = ("pack", "unpack", "unpack_partial", "read")
+
+
 class PackableStruct(Generic[P], Struct[P]):
+    __slots__ = ()
+
+    @specializable
     def pack(self, byte_order: ByteOrder = ByteOrder.NETWORK) -> bytes:
-        # TODO: Combine the formats and use a single struct.pack instead
+        packer = self.__class__._PACKERS.get(byte_order)
+        if packer is not None:
+            return packer.pack(
+                *(getattr(self, field_name) for field_name in self.__class__.FIELDS)
+            )
+        if self.__class__.RAW_INTS:
+            return b"".join(
+                field_type(getattr(self, field_name)).pack(byte_order)
+                for field_name, field_type in self.__class__.FIELDS.items()
+            )
         return b"".join(
             getattr(self, field_name).pack(byte_order)
             for field_name in self.__class__.FIELDS.keys()
         )
 
+    def pack_into(
+        self,
+        buffer: Union[bytearray, memoryview],
+        offset: int = 0,
+        byte_order: ByteOrder = ByteOrder.NETWORK,
+    ) -> int:
+        """Packs this struct into `buffer` starting at `offset`, returning the number of bytes written"""
+        packer = self.__class__._PACKERS.get(byte_order)
+        if packer is not None:
+            packer.pack_into(
+                buffer,
+                offset,
+                *(getattr(self, field_name) for field_name in self.__class__.FIELDS),
+            )
+            return packer.size
+        packed = self.pack(byte_order)
+        if offset + len(packed) > len(buffer):
+            # slice assignment would silently grow a bytearray, so fail the same way that `struct.pack_into` does
+            raise struct.error(
+                f"pack_into requires a buffer of at least {offset + len(packed)} bytes for packing {len(packed)} "
+                f"bytes at offset {offset} (actual buffer size is {len(buffer)})"
+            )
+        buffer[offset : offset + len(packed)] = packed
+        return len(packed)
+
+    @classmethod
+    def pack_many(
+        cls: Type[P], items: Sequence[P], byte_order: ByteOrder = ByteOrder.NETWORK
+    ) -> bytes:
+        """Packs a sequence of structs back-to-back into a single pre-sized buffer"""
+        packer = cls._PACKERS.get(byte_order)
+        if packer is None:
+            return b"".join(item.pack(byte_order) for item in items)
+        buffer = bytearray(len(items) * packer.size)
+        for i, item in enumerate(items):
+            packer.pack_into(
+                buffer,
+                i * packer.size,
+                *(getattr(item, field_name) for field_name in cls.FIELDS),
+            )
+        return bytes(buffer)
+
     @classmethod
     def validate_fields(cls, fields: OrderedDictType[str, Type[F]]):
         for field_name, field_type in fields.items():
-            if not isinstance(field_type, Packable):
+            # check for the methods directly rather than through the runtime-checkable `Packable` protocol, whose
+            # isinstance checks are slow and would otherwise run for every field of every struct class definition
+            if not all(
+                callable(getattr(field_type, method_name, None))
+                for method_name in PACKABLE_METHODS
+            ):
                 raise TypeError(
                     f"Field {field_name} of {cls.__name__} must be Packable, not {field_type}"
                 )
@@ -177,6 +684,10 @@ class PackableStruct(Generic[P], Struct[P]):
     def unpack_partial(
         cls: Type[P], data: bytes, byte_order: ByteOrder = ByteOrder.NETWORK
     ) -> Tuple[P, bytes]:
+        packer = cls._PACKERS.get(byte_order)
+        if packer is not None and len(data) >= packer.size:
+            # struct.Struct already guarantees that every value fits its field
+            return cls._from_raw(*packer.unpack_from(data)), data[packer.size :]
         remaining_data = data
         args = []
         for field_name, field_type in cls.FIELDS.items():
@@ -201,6 +712,42 @@ class PackableStruct(Generic[P], Struct[P]):
             args.append(field)
         return cls(*args), remaining_data
 
+    @classmethod
+    def iter_unpack(
+        cls: Type[P], data: bytes, byte_order: ByteOrder = ByteOrder.NETWORK
+    ) -> Iterator[P]:
+        """Unpacks back-to-back fixed size structs from `data`"""
+        if cls.num_bytes == 0:
+            # there is no way to tell how many empty structs are packed back-to-back
+            raise UnpackError(f"Cannot unpack a sequence of {cls.__name__}, which has a size of zero bytes")
+        elif len(data) % cls.num_bytes:
+            raise UnpackError(
+                f"Expected a multiple of {cls.num_bytes} bytes, but got {len(data)}"
+            )
+        packer = cls._PACKERS.get(byte_order)
+        if packer is not None:
+            for values in packer.iter_unpack(data):
+                yield cls._from_raw(*values)
+            return
+        for offset in range(0, len(data), cls.num_bytes):
+            yield cls.unpack(data[offset : offset + cls.num_bytes], byte_order)
+
+    @classmethod
+    def unpack_many(
+        cls, data: bytes, byte_order: ByteOrder = ByteOrder.NETWORK
+    ) -> np.ndarray:
+        """Unpacks back-to-back structs into a numpy structured array with one column per field
+
+        No Python objects are created per struct; the array is a zero-copy view of `data`.
+
+        """
+        if byte_order not in cls._NP_DTYPES:
+            raise TypeError(
+                f"{cls.__name__} cannot be unpacked in bulk with byte order {byte_order}; all of its fields must "
+                "be `SizedInteger`s"
+            )
+        return np.frombuffer(data, dtype=cls._NP_DTYPES[byte_order])
+
     @classmethod
     async def read(
         cls: Type[P],
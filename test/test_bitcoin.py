@@ -1,9 +1,36 @@
+import asyncio
 import time
 from ipaddress import ip_address
 from unittest import TestCase
 
-from fluxture.bitcoin import BitcoinMessage, NetAddr, VersionMessage
-from fluxture.serialization import ByteOrder
+from fluxture.bitcoin import (AbstractList, AddressList, AddrMessage, BitcoinMessage, BitcoinNode, NetAddr,
+                              NetIP, Ping, VerackMessage, VersionMessage)
+from fluxture.serialization import ByteOrder, UInt32
+from fluxture.structures import PackableStruct
+
+
+class UInt32List(AbstractList[UInt32]):
+    ELEMENT_TYPE = UInt32
+
+
+class Empty(PackableStruct):
+    pass
+
+
+class EmptyList(AbstractList[Empty]):
+    ELEMENT_TYPE = Empty
+
+
+class FakeWriter:
+    def __init__(self):
+        self.writes = []
+        self.drains = 0
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+    async def drain(self):
+        self.drains += 1
 
 EXAMPLE_VERSION_MESSAGE = b"".join([
     b"\x72\x11\x01\x00",                  # Protocol version: 70002
@@ -48,3 +75,38 @@ class TestBitcoin(TestCase):
         self.assertEqual(msg.addr_from.port, 8333)
         self.assertEqual(msg.addr_recv.ip, ip_address("::ffff:c61b:6409"))
         self.assertEqual(msg.addr_from.ip, ip_address("::ffff:cb00:71c0"))
+
+    def test_addr_message(self):
+        msg = AddrMessage(addresses=AddressList(
+            NetIP(time=i, addr=NetAddr(ip=f"10.0.0.{i}", port=8333 + i)) for i in range(10)
+        ))
+        deserialized = BitcoinMessage.deserialize(msg.serialize())
+        self.assertEqual(msg, deserialized)
+        self.assertEqual(deserialized.addresses[3].addr.port, 8336)
+
+    def test_serialize_into(self):
+        messages = [Ping(nonce=1234), VerackMessage(), Ping(nonce=5678)]
+        buffer = bytearray()
+        for msg in messages:
+            msg.serialize_into(buffer)
+        self.assertEqual(bytes(buffer), b"".join(msg.serialize() for msg in messages))
+
+    def test_integer_list(self):
+        integers = UInt32List(UInt32(i) for i in (1, 2, 3))
+        self.assertEqual(integers.pack(), b"\x03" + b"".join(UInt32(i).pack() for i in (1, 2, 3)))
+        self.assertEqual(UInt32List.unpack(integers.pack()), integers)
+
+    def test_send_messages(self):
+        messages = [Ping(nonce=1234), VerackMessage(), Ping(nonce=5678)]
+        node = BitcoinNode("127.0.0.1")
+        writer = FakeWriter()
+        node._writer = writer
+        asyncio.run(node.send_messages(messages))
+        self.assertEqual(writer.writes, [b"".join(msg.serialize() for msg in messages)])
+        self.assertEqual(writer.drains, 1)
+
+    def test_empty_element_list(self):
+        empties = EmptyList([Empty(), Empty()])
+        self.assertEqual(empties.pack(), b"\x02")
+        self.assertEqual(EmptyList.unpack(empties.pack()), empties)
+        self.assertEqual(EmptyList.unpack(b"\x00"), EmptyList())
@@ -1,5 +1,7 @@
 import inspect
 import random
+import struct
+import weakref
 
 from fluxture.structures import PackableStruct
 from tqdm import tqdm, trange
@@ -9,6 +11,22 @@ from unittest import TestCase
 from fluxture.serialization import *
 
 
+class Mixin:
+    def __init__(self):
+        self.extra = 1
+        super().__init__()
+
+
+class ForwardReferencing(PackableStruct):
+    a: UInt8
+    b: "DefinedLater"
+
+
+class DefinedLater(PackableStruct):
+    c: UInt16
+    d: "UInt32"
+
+
 class TestTypes(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -81,6 +99,17 @@ class TestTypes(TestCase):
                 packed = int_type(value).pack()
                 self.assertEqual(int_type.unpack(packed), value)
 
+    def test_sized_integer_range(self):
+        for int_type in (Int8, UInt8, Int16, UInt16, Int32, UInt32, Int64, UInt64):
+            int_type(int_type.MIN_VALUE)
+            int_type(int_type.MAX_VALUE)
+            self.assertRaises(ValueError, int_type, int_type.MIN_VALUE - 1)
+            self.assertRaises(ValueError, int_type, int_type.MAX_VALUE + 1)
+
+    def test_sized_integer_slots(self):
+        for int_type in self.sized_integer_types + [BigEndian[UInt32], LittleEndian[UInt32]]:
+            self.assertFalse(hasattr(int_type(0), "__dict__"), f"{int_type.__name__} instances have a __dict__")
+
     def test_empty_struct(self):
         class EmptyStruct(PackableStruct):
             pass
@@ -121,3 +150,288 @@ class TestTypes(TestCase):
         self.assertRaises(ValueError, HasArrays, (b"abcd", b"defg", b"hijk"))
         has_arrays = HasArrays(b"abcd", b"", b"hijk")
         self.assertEqual(HasArrays.unpack(has_arrays.pack()), has_arrays)
+
+    def test_fused_struct_packing(self):
+        class S4(PackableStruct):
+            a: UInt8
+            b: Int32
+            c: UInt16
+
+        class S5(PackableStruct):
+            a: UInt8
+            b: BigEndian[UInt16]
+
+        s4 = S4(1, -2, 3)
+        for byte_order in (ByteOrder.NETWORK, ByteOrder.LITTLE, ByteOrder.BIG):
+            self.assertIn(byte_order, S4._PACKERS)
+            expected = b"".join(getattr(s4, name).pack(byte_order) for name in S4.FIELDS)
+            self.assertEqual(s4.pack(byte_order), expected)
+            self.assertEqual(S4.unpack(expected, byte_order), s4)
+            self.assertIsInstance(S4.unpack(expected, byte_order).b, Int32)
+        self.assertEqual(S5._PACKERS, {})
+        self.assertEqual(S5(1, 2).pack(ByteOrder.LITTLE), b"\x01\x00\x02")
+        self.assertRaises(UnpackError, S4.unpack, b"\x01\x02")
+
+    def test_struct_slots(self):
+        class S6(PackableStruct, slots=True):
+            a: UInt8
+            b: UInt16
+
+        class S6Child(S6):
+            non_serialized = ()
+            c: UInt8
+
+        s6 = S6(1, 2)
+        self.assertEqual(S6.__slots__, ("a", "b"))
+        self.assertFalse(hasattr(s6, "__dict__"))
+        self.assertRaises(AttributeError, setattr, s6, "c", 3)
+        self.assertEqual(S6Child.__slots__, ("c",))
+        self.assertFalse(hasattr(S6Child(c=3), "__dict__"))
+
+        class Marker(PackableStruct):
+            def __init__(self):
+                super().__init__()
+                self.received_at = 1
+
+        # structs that do not opt in keep their __dict__ and weakref support, even without fields
+        self.assertEqual(Marker().received_at, 1)
+        self.assertIsNotNone(weakref.ref(Marker()))
+
+    def test_struct_multiple_inheritance(self):
+        class S22(PackableStruct):
+            non_serialized = ()
+            a: UInt8
+
+        class S23(PackableStruct):
+            non_serialized = ()
+            b: UInt16
+
+        class S24(S22, S23):
+            pass
+
+        self.assertEqual(list(S24.FIELDS), ["a", "b"])
+        s = S24(1, 2)
+        self.assertEqual((s.a, s.b), (1, 2))
+
+    def test_struct_init(self):
+        class Color(IntEnum):
+            RED = 0
+            GREEN = 1
+
+        class S7(PackableStruct):
+            a: UInt8
+            color: Color
+
+        class S8(PackableStruct):
+            a: UInt8
+
+            def __init__(self, a: int = 7):
+                super().__init__(a=a)
+
+        self.assertEqual(S7(1).color, Color.RED)
+        self.assertEqual(S7(color=Color.GREEN, a=1).color, Color.GREEN)
+        self.assertIsInstance(S7(1).a, UInt8)
+        self.assertRaises(ValueError, S7)
+        self.assertRaises(ValueError, S7, 1, Color.RED, 2)
+        self.assertRaises(TypeError, S7, 1, b=2)
+        self.assertEqual(S8().a, 7)
+
+    def test_struct_init_positional_fill(self):
+        class S19(PackableStruct):
+            non_serialized = ()
+            x: UInt8
+            y: UInt8
+
+        class S20(S19):
+            z: UInt8
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+
+        # positional arguments fill whichever fields were not passed by keyword
+        s = S19(5, x=1)
+        self.assertEqual((s.x, s.y), (1, 5))
+        s = S20(1, 2, 3)
+        self.assertEqual((s.x, s.y, s.z), (1, 2, 3))
+        s = S20(2, 3, x=1)
+        self.assertEqual((s.x, s.y, s.z), (1, 2, 3))
+        self.assertRaises(ValueError, S19, 1, 2, x=1)
+
+    def test_struct_pack_into(self):
+        class S9(PackableStruct):
+            a: UInt8
+            b: UInt32
+
+        items = [S9(i, i * 1000) for i in range(10)]
+        expected = b"".join(item.pack() for item in items)
+        self.assertEqual(S9.pack_many(items), expected)
+        self.assertEqual(list(S9.iter_unpack(expected)), items)
+        self.assertRaises(UnpackError, list, S9.iter_unpack(expected[:-1]))
+
+        class S34(PackableStruct):
+            pass
+
+        self.assertRaises(UnpackError, list, S34.iter_unpack(b""))
+        buffer = bytearray(2 + S9.num_bytes)
+        self.assertEqual(items[3].pack_into(buffer, 2), S9.num_bytes)
+        self.assertEqual(bytes(buffer[2:]), items[3].pack())
+        self.assertRaises(struct.error, items[3].pack_into, bytearray(2), 5)
+
+        class S25(PackableStruct):
+            a: UInt8
+            b: SizedByteArray[2]
+
+        buffer = bytearray(4)
+        self.assertEqual(S25(1, b"ab").pack_into(buffer, 1), 3)
+        self.assertEqual(bytes(buffer), b"\x00\x01ab")
+        self.assertRaises(struct.error, S25(1, b"ab").pack_into, bytearray(2), 5)
+        self.assertRaises(UnpackError, list, S25.iter_unpack(b"\x01ab\x02"))
+
+    def test_struct_unpack_many(self):
+        class S10(PackableStruct):
+            a: Int8
+            b: UInt32
+            c: UInt16
+
+        items = [S10(-i, i * 1000, i) for i in range(10)]
+        for byte_order in (ByteOrder.NETWORK, ByteOrder.LITTLE):
+            unpacked = S10.unpack_many(S10.pack_many(items, byte_order), byte_order)
+            self.assertEqual(len(unpacked), len(items))
+            self.assertEqual(list(unpacked["a"]), [item.a for item in items])
+            self.assertEqual(list(unpacked["b"]), [item.b for item in items])
+            self.assertEqual(list(unpacked["c"]), [item.c for item in items])
+
+        class S11(PackableStruct):
+            a: SizedByteArray[4]
+
+        self.assertRaises(TypeError, S11.unpack_many, b"abcd")
+
+    def test_struct_hash(self):
+        class S12(PackableStruct):
+            a: UInt8
+            b: UInt16
+
+        class S13(PackableStruct):
+            a: UInt8
+            b: UInt16
+
+        self.assertEqual(S12(1, 2), S12(1, 2))
+        self.assertNotEqual(S12(1, 2), S12(1, 3))
+        self.assertEqual(S12(1, 2), S13(1, 2))
+        self.assertEqual(hash(S12(1, 2)), hash(S13(1, 2)))
+        self.assertEqual(len({S12(1, 2), S12(1, 2), S12(2, 1)}), 2)
+
+    def test_forward_referenced_fields(self):
+        self.assertEqual(DefinedLater.FIELDS["d"], UInt32)
+        self.assertEqual(ForwardReferencing.num_bytes, 7)
+        self.assertEqual(ForwardReferencing.FIELDS["b"], DefinedLater)
+        s = ForwardReferencing(1, DefinedLater(2, 3))
+        self.assertEqual(ForwardReferencing.unpack(s.pack()), s)
+
+    def test_struct_raw_ints(self):
+        class S14(PackableStruct, raw_ints=True):
+            a: UInt8
+            b: Int16
+            c: UInt32
+
+        s = S14(1, -2, 3)
+        self.assertIs(type(s.a), int)
+        self.assertEqual(s.pack(), S14(1, -2, 3).pack())
+        unpacked = S14.unpack(s.pack())
+        self.assertEqual(unpacked, s)
+        self.assertIs(type(unpacked.c), int)
+        self.assertEqual(s.pack(ByteOrder.LITTLE), b"\x01\xfe\xff\x03\x00\x00\x00")
+
+        class S15(S14):
+            pass
+
+        self.assertTrue(S15.RAW_INTS)
+
+        def define_invalid_raw_int_struct():
+            class S16(PackableStruct, raw_ints=True):
+                a: UInt8
+                b: SizedByteArray[4]
+
+        self.assertRaises(TypeError, define_invalid_raw_int_struct)
+
+    def test_struct_str(self):
+        class S17(PackableStruct):
+            pass
+
+        class S18(PackableStruct):
+            a: UInt8
+            b: SizedByteArray[2]
+
+        self.assertEqual(str(S17()), "typedef struct {} S17")
+        self.assertEqual(str(S18(1, b"ab")), "typedef struct {\n    a = uint8_t(1);\n    b = b'ab';\n} S18")
+
+    def test_struct_builtin_field_names(self):
+        class S21(PackableStruct):
+            isinstance: UInt8
+            len: UInt8
+            hash: UInt8
+
+        s = S21(1, 2, 3)
+        self.assertEqual((s.isinstance, s.len, s.hash), (1, 2, 3))
+        self.assertEqual(S21(len=2, hash=3, isinstance=1), s)
+        self.assertEqual(hash(s), hash(S21(1, 2, 3)))
+
+    def test_struct_field_validation(self):
+        class PackOnly:
+            def pack(self, byte_order: ByteOrder = ByteOrder.NETWORK) -> bytes:
+                return b""
+
+            @classmethod
+            def unpack(cls, data: bytes, byte_order: ByteOrder = ByteOrder.NETWORK):
+                return cls()
+
+        def define_struct():
+            class S26(PackableStruct):
+                a: PackOnly
+
+        self.assertRaises(TypeError, define_struct)
+
+    def test_struct_pack_super(self):
+        class S27(PackableStruct):
+            non_serialized = ()
+            a: UInt8
+
+        class S28(S27):
+            b: UInt8
+
+            def pack(self, byte_order: ByteOrder = ByteOrder.NETWORK) -> bytes:
+                return super().pack(byte_order)
+
+        self.assertEqual(S28(1, 2).pack(), b"\x01\x02")
+        self.assertEqual(S28(1, 2).pack(ByteOrder.LITTLE), b"\x01\x02")
+
+    def test_struct_cooperative_init(self):
+        class S29(PackableStruct, Mixin):
+            a: UInt8
+
+        self.assertEqual(S29(1).extra, 1)
+        unpacked = S29.unpack(S29(3).pack())
+        self.assertEqual(unpacked.a, 3)
+        self.assertEqual(unpacked.extra, 1)
+
+    def test_function_local_forward_references(self):
+        class S30(PackableStruct):
+            a: UInt8
+            b: "S31"
+
+        class S31(PackableStruct):
+            c: UInt16
+
+        class S32(PackableStruct):
+            d: "S31"
+
+        self.assertEqual(S30.FIELDS["b"], S31)
+        self.assertEqual(S32.FIELDS["d"], S31)
+        s = S30(1, S31(2))
+        self.assertEqual(S30.unpack(s.pack()), s)
+
+        class S33(PackableStruct):
+            a: "UInt8Typo"
+
+        with self.assertRaisesRegex(NameError, "field a of S33"):
+            S33(1)